@@ -0,0 +1,70 @@
+import argparse
+import time
+
+import numpy as np
+
+from src.dqn_agent import build_mlp
+from src.parallel_learner import ParallelLearner
+
+NETWORKS = {
+    "mlp-128-128": (128, 128),
+    "mlp-1024x3": (1024, 1024, 1024),
+}
+STATE_SIZE = 11
+ACTION_SIZE = 4
+
+
+def bench(hidden_sizes, num_workers, batch_size, num_updates, warmup=5):
+    """
+    Updates/sec and samples/sec for one (network, workers) setting.
+
+    num_workers=0 is in-process Keras train_on_batch with TF's default
+    thread pool; num_workers>=1 is ParallelLearner with 1-thread workers.
+    """
+    model = build_mlp(STATE_SIZE, ACTION_SIZE, hidden_sizes)
+    model.compile(loss="mse", optimizer="adam")
+    rng = np.random.default_rng(0)
+    states = rng.integers(0, 2, (batch_size, STATE_SIZE)).astype(np.float32)
+    targets = rng.normal(size=(batch_size, ACTION_SIZE)).astype(np.float32)
+
+    learner = None
+    if num_workers > 0:
+        learner = ParallelLearner(model, num_workers)
+        update = lambda: learner.train_on_batch(states, targets)
+    else:
+        update = lambda: model.train_on_batch(states, targets)
+
+    for _ in range(warmup):
+        update()
+    t0 = time.perf_counter()
+    for _ in range(num_updates):
+        update()
+    elapsed = time.perf_counter() - t0
+    if learner is not None:
+        learner.close()
+
+    updates_per_sec = num_updates / elapsed
+    return updates_per_sec, updates_per_sec * batch_size
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Scaling benchmark for the data-parallel learner.")
+    parser.add_argument("--max-workers", type=int, default=4)
+    parser.add_argument("--batch-size", type=int, default=1024)
+    parser.add_argument("--updates", type=int, default=50)
+    args = parser.parse_args()
+
+    print(f"batch size {args.batch_size}, {args.updates} updates; "
+          f"'keras' = in-process, all TF threads; "
+          f"N = ParallelLearner, N workers x 1 thread")
+    print(f"{'network':<14}{'workers':>8}{'updates/s':>12}{'samples/s':>12}")
+    for name, hidden in NETWORKS.items():
+        for workers in range(0, args.max_workers + 1):
+            ups, sps = bench(hidden, workers, args.batch_size, args.updates)
+            label = workers if workers else "keras"
+            print(f"{name:<14}{label:>8}{ups:>12.1f}{sps:>12.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+import argparse
+import random
+import time
+import tracemalloc
+from collections import deque
+
+import numpy as np
+
+from src.compact_replay import CompactReplayBuffer
+from src.snake_env import SnakeEnv
+
+STATE_SIZE = 11
+BATCH_SIZE = 64
+
+
+def collect(num_transitions, seed=0):
+    """Real SnakeEnv transitions from a random policy."""
+    random.seed(seed)
+    np.random.seed(seed)
+    env = SnakeEnv(render=False)
+    out = []
+    state = env.reset()
+    while len(out) < num_transitions:
+        action = np.random.randint(env.action_space)
+        next_state, reward, done, _ = env.step(action)
+        out.append((state, action, reward, next_state, done))
+        state = env.reset() if done else next_state
+    return out
+
+
+def fill(memory, transitions, total):
+    """Fill `total` slots by repeating the collected transitions."""
+    while total > 0:
+        chunk = transitions[:total]
+        memory.extend(chunk)
+        total -= len(chunk)
+
+
+def deque_bytes_per_transition(num_transitions):
+    """
+    Footprint of DQNAgent.memory as the training loop fills it: no copies,
+    next_state of step t is the same array object as state of step t+1.
+    """
+    tracemalloc.start()
+    transitions = collect(num_transitions)
+    used, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return used / num_transitions, transitions
+
+
+def sample_rate(sample_fn, seconds=2.0):
+    """Sampled transitions per second (batches of BATCH_SIZE)."""
+    calls = 0
+    t0 = time.perf_counter()
+    while time.perf_counter() - t0 < seconds:
+        sample_fn()
+        calls += 1
+    return calls * BATCH_SIZE / (time.perf_counter() - t0)
+
+
+def sample_deque(memory):
+    minibatch = random.sample(memory, BATCH_SIZE)
+    return (np.array([m[0] for m in minibatch]),
+            np.array([m[1] for m in minibatch]),
+            np.array([m[2] for m in minibatch]),
+            np.array([m[3] for m in minibatch]),
+            np.array([m[4] for m in minibatch]))
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Replay memory footprint and sampling throughput.")
+    parser.add_argument("--capacity", type=int, default=10_000_000)
+    parser.add_argument("--deque-fill", type=int, default=200_000,
+                        help="distinct transitions collected (deque bytes "
+                             "per transition are measured on these)")
+    args = parser.parse_args()
+
+    deque_bpt, transitions = deque_bytes_per_transition(args.deque_fill)
+
+    # sampling cost depends on deque length (indexing is O(n)), so time it
+    # at full capacity; repeated references keep this to ~8 bytes/slot
+    memory = deque(maxlen=args.capacity)
+    fill(memory, transitions, args.capacity)
+    deque_rate = sample_rate(lambda: sample_deque(memory))
+    del memory
+
+    compact = CompactReplayBuffer(args.capacity, STATE_SIZE, seed=0)
+    fill(compact, transitions, args.capacity)
+    compact_bpt = compact.nbytes / args.capacity
+    compact_rate = sample_rate(lambda: compact.sample(BATCH_SIZE))
+
+    print(f"capacity {args.capacity:,}, batch {BATCH_SIZE}")
+    print(f"{'memory':<10}{'bytes/tr':>10}{'total MB':>12}{'samples/s':>14}")
+    print(f"{'deque':<10}{deque_bpt:>10.1f}"
+          f"{deque_bpt * args.capacity / 2**20:>12.0f}{deque_rate:>14.0f}"
+          f"   (bytes/tr measured on {len(transitions):,} transitions)")
+    print(f"{'compact':<10}{compact_bpt:>10.2f}"
+          f"{compact.nbytes / 2**20:>12.0f}{compact_rate:>14.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+import numpy as np
+
+
+class CompactReplayBuffer:
+    """
+    Ring-buffer replay memory for binary observations.
+
+    Each 0/1 feature vector (up to 16 features) is packed into one uint16,
+    actions are uint8, rewards float16 (all shaped rewards of SnakeEnv are
+    exact in float16) and dones one bit each: ~7 bytes per transition
+    instead of several hundred for the tuple deque.
+    """
+
+    def __init__(self, capacity, state_size, seed=None):
+        if state_size > 16:
+            raise ValueError("CompactReplayBuffer packs at most 16 features")
+        self.capacity = capacity
+        self.state_size = state_size
+
+        self.states = np.zeros(capacity, dtype=np.uint16)
+        self.next_states = np.zeros(capacity, dtype=np.uint16)
+        self.actions = np.zeros(capacity, dtype=np.uint8)
+        self.rewards = np.zeros(capacity, dtype=np.float16)
+        self.dones = np.zeros((capacity + 7) // 8, dtype=np.uint8)
+
+        self._bits = np.arange(state_size, dtype=np.uint16)
+        self._weights = (1 << self._bits).astype(np.uint16)
+        self._rng = np.random.default_rng(seed)
+        self._next = 0
+        self._size = 0
+
+    def __len__(self):
+        return self._size
+
+    @property
+    def nbytes(self):
+        return (self.states.nbytes + self.next_states.nbytes
+                + self.actions.nbytes + self.rewards.nbytes
+                + self.dones.nbytes)
+
+    def pack(self, states):
+        """0/1 feature vector(s) -> uint16 code(s)."""
+        bits = np.asarray(states) > 0.5
+        return (bits @ self._weights.astype(np.int64)).astype(np.uint16)
+
+    def unpack(self, codes):
+        """uint16 codes -> (n, state_size) float32 array."""
+        return ((codes[:, np.newaxis] >> self._bits) & 1).astype(np.float32)
+
+    def append(self, transition):
+        """Store one (state, action, reward, next_state, done), like deque."""
+        state, action, reward, next_state, done = transition
+        i = self._next
+        self.states[i] = self.pack(state)
+        self.next_states[i] = self.pack(next_state)
+        self.actions[i] = action
+        self.rewards[i] = reward
+
+        byte, bit = divmod(i, 8)
+        if done:
+            self.dones[byte] |= np.uint8(1 << bit)
+        else:
+            self.dones[byte] &= np.uint8(~(1 << bit) & 0xFF)
+
+        self._next = (i + 1) % self.capacity
+        self._size = min(self._size + 1, self.capacity)
+
+    def extend(self, transitions):
+        """Store many transitions at once (vectorized pack and write)."""
+        transitions = list(transitions)
+        n_total = len(transitions)
+        if n_total == 0:
+            return
+        # only the last `capacity` survive, at the slots append() would use
+        skip = max(n_total - self.capacity, 0)
+        transitions = transitions[skip:]
+        n = len(transitions)
+        states, actions, rewards, next_states, dones = zip(*transitions)
+
+        idx = (self._next + skip + np.arange(n)) % self.capacity
+        self.states[idx] = self.pack(np.array(states))
+        self.next_states[idx] = self.pack(np.array(next_states))
+        self.actions[idx] = np.array(actions)
+        self.rewards[idx] = np.array(rewards)
+
+        # ufunc.at so several writes into the same byte all apply
+        byte = idx >> 3
+        mask = (1 << (idx & 7)).astype(np.uint8)
+        np.bitwise_and.at(self.dones, byte, ~mask)
+        done = np.array(dones, dtype=bool)
+        np.bitwise_or.at(self.dones, byte[done], mask[done])
+
+        self._next = int((self._next + n_total) % self.capacity)
+        self._size = min(self._size + n_total, self.capacity)
+
+    def sample(self, batch_size):
+        """Uniform minibatch (with replacement), unpacked to arrays."""
+        idx = self._rng.integers(0, self._size, size=batch_size)
+        dones = (self.dones[idx >> 3] >> (idx & 7).astype(np.uint8)) & 1
+        return (self.unpack(self.states[idx]),
+                self.actions[idx].astype(np.int64),
+                self.rewards[idx].astype(np.float32),
+                self.unpack(self.next_states[idx]),
+                dones.astype(bool))
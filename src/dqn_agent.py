@@ -4,13 +4,28 @@ from collections import deque
 import tensorflow as tf
 from tensorflow.keras import layers, models, optimizers
 
+def build_mlp(state_size, action_size, hidden_sizes=(128, 128)):
+    """Simple MLP for Q-values (uncompiled)."""
+    model = models.Sequential()
+    model.add(layers.Input(shape=(state_size,)))
+    for units in hidden_sizes:
+        model.add(layers.Dense(units, activation="relu"))
+    model.add(layers.Dense(action_size, activation="linear"))
+    return model
+
 class DQNAgent:
-    def __init__(self, state_size, action_size):
+    def __init__(self, state_size, action_size, hidden_sizes=(128, 128),
+                 num_learners=1, memory_size=50000, compact_memory=False):
         self.state_size = state_size
         self.action_size = action_size
+        self.hidden_sizes = tuple(hidden_sizes)
 
-        # replay buffer
-        self.memory = deque(maxlen=50000)
+        # replay buffer (compact: bit-packed arrays, for large capacities)
+        if compact_memory:
+            from src.compact_replay import CompactReplayBuffer
+            self.memory = CompactReplayBuffer(memory_size, state_size)
+        else:
+            self.memory = deque(maxlen=memory_size)
 
         # hyperparams
         self.gamma = 0.99       # discount
@@ -18,6 +33,7 @@ class DQNAgent:
         self.epsilon_min = 0.05
         self.epsilon_decay = 0.995
         self.batch_size = 64
+        self.fit_batch_size = 32  # Keras fit default: 2 Adam steps per replay
         self.learning_rate = 1e-3
 
         # main & target networks
@@ -25,13 +41,15 @@ class DQNAgent:
         self.target_model = self._build_model()
         self._update_target_model()
 
+        # optional data-parallel learner (worker processes)
+        self.learner = None
+        if num_learners > 1:
+            from src.parallel_learner import ParallelLearner
+            self.learner = ParallelLearner(self.model, num_learners)
+
     def _build_model(self):
         """Simple MLP for Q-values."""
-        model = models.Sequential()
-        model.add(layers.Input(shape=(self.state_size,)))
-        model.add(layers.Dense(128, activation="relu"))
-        model.add(layers.Dense(128, activation="relu"))
-        model.add(layers.Dense(self.action_size, activation="linear"))
+        model = build_mlp(self.state_size, self.action_size, self.hidden_sizes)
         model.compile(
             loss="mse",
             optimizer=optimizers.Adam(learning_rate=self.learning_rate)
@@ -58,13 +76,17 @@ class DQNAgent:
         if len(self.memory) < self.batch_size:
             return
 
-        minibatch = random.sample(self.memory, self.batch_size)
+        if isinstance(self.memory, deque):
+            minibatch = random.sample(self.memory, self.batch_size)
 
-        states = np.array([m[0] for m in minibatch])
-        actions = np.array([m[1] for m in minibatch])
-        rewards = np.array([m[2] for m in minibatch])
-        next_states = np.array([m[3] for m in minibatch])
-        dones = np.array([m[4] for m in minibatch])
+            states = np.array([m[0] for m in minibatch])
+            actions = np.array([m[1] for m in minibatch])
+            rewards = np.array([m[2] for m in minibatch])
+            next_states = np.array([m[3] for m in minibatch])
+            dones = np.array([m[4] for m in minibatch])
+        else:
+            states, actions, rewards, next_states, dones = \
+                self.memory.sample(self.batch_size)
 
         # Q(s,a) update target
         target_q = self.model.predict(states, verbose=0)
@@ -76,7 +98,11 @@ class DQNAgent:
             else:
                 target_q[i, actions[i]] = rewards[i] + self.gamma * np.max(next_q[i])
 
-        self.model.fit(states, target_q, epochs=1, verbose=0)
+        if self.learner is not None:
+            self.learner.fit(states, target_q, batch_size=self.fit_batch_size)
+        else:
+            self.model.fit(states, target_q, batch_size=self.fit_batch_size,
+                           epochs=1, verbose=0)
 
         # epsilon decay
         if self.epsilon > self.epsilon_min:
@@ -95,5 +121,14 @@ class DQNAgent:
             optimizer=optimizers.Adam(learning_rate=self.learning_rate)
         )
 
+        if self.learner is not None:
+            self.learner.set_model(self.model)
+
         # update target network
         self._update_target_model()
+
+    def close(self):
+        """Stop learner worker processes (if any)."""
+        if self.learner is not None:
+            self.learner.close()
+            self.learner = None
@@ -1,209 +1,186 @@
-import pygame
-import random
-
-pygame.init()
-
-# --- Nokia logical screen ---
-SCREEN_W = 84   # total width (Nokia)
-SCREEN_H = 48   # total height (Nokia)
-UI_H     = 8    # top bar height (score area)
-
-# --- Playfield (centered inside screen) ---
-PLAY_W = 72     # playfield width (cells)
-PLAY_H = 32     # playfield height (cells)
-
-MARGIN_X_PLAY = (SCREEN_W - PLAY_W) // 2             # left/right margin
-MARGIN_Y_PLAY = (SCREEN_H - UI_H - PLAY_H) // 2      # margin between UI and bottom
-MARGIN_X = MARGIN_X_PLAY
-MARGIN_Y = UI_H + MARGIN_Y_PLAY                      # top of playfield
-
-# --- Scale factor (for PC window) ---
-SCALE  = 8
-WIDTH  = SCREEN_W * SCALE
-HEIGHT = SCREEN_H * SCALE
-SNAKE_SPEED = 12
-
-# --- Colors ---
-OUT_BG_COLOR      = (5, 20, 5)       # outside playfield
-PLAY_BG_COLOR     = (15, 56, 15)     # inside playfield
-UI_BG_COLOR       = (10, 35, 10)     # top bar
-BORDER_COLOR      = (0, 0, 0)
-SNAKE_BODY_COLOR  = (48, 98, 48)
-SNAKE_HEAD_COLOR  = (139, 172, 15)
-FOOD_COLOR        = (0, 0, 0)
-TEXT_COLOR        = (200, 200, 200)
-
-screen = pygame.display.set_mode((WIDTH, HEIGHT))
-pygame.display.set_caption("Snake - Nokia style")
-
-clock = pygame.time.Clock()
-font_style = pygame.font.SysFont("bahnschrift", 16)
-
-
-# --- Helpers ---
-
-def grid_to_screen(gx, gy):
-    """Grid -> screen coords (scaled)."""
-    sx = (MARGIN_X + gx) * SCALE
-    sy = (MARGIN_Y + gy) * SCALE
-    return sx, sy
-
-
-def draw_snake(snake_list):
-    """Draw snake body and head."""
-    if not snake_list:
-        return
-    # body
-    for gx, gy in snake_list[:-1]:
-        sx, sy = grid_to_screen(gx, gy)
-        pygame.draw.rect(screen, SNAKE_BODY_COLOR, [sx, sy, SCALE, SCALE])
-    # head
-    hx, hy = snake_list[-1]
-    sx, sy = grid_to_screen(hx, hy)
-    pygame.draw.rect(screen, SNAKE_HEAD_COLOR, [sx, sy, SCALE, SCALE])
-
-
-def draw_food(fx, fy):
-    """Draw food."""
-    sx, sy = grid_to_screen(fx, fy)
-    pygame.draw.rect(screen, FOOD_COLOR, [sx, sy, SCALE, SCALE])
-
-
-def draw_ui(score):
-    """Draw top bar and score."""
-    pygame.draw.rect(screen, UI_BG_COLOR, [0, 0, WIDTH, UI_H * SCALE])
-    text = font_style.render(f"Score: {score}", True, TEXT_COLOR)
-    screen.blit(text, (4, 2))
-
-
-def draw_playfield_bg_and_border():
-    """Draw playfield background and border."""
-    # playfield background (lighter green)
-    x = MARGIN_X * SCALE
-    y = MARGIN_Y * SCALE
-    w = PLAY_W * SCALE
-    h = PLAY_H * SCALE
-    pygame.draw.rect(screen, PLAY_BG_COLOR, [x, y, w, h])
-    # border (black rectangle)
-    pygame.draw.rect(screen, BORDER_COLOR, [x, y, w, h], width=1)
+from itertools import islice
 
+import pygame
 
-def message_center(msg):
-    """Draw centered message."""
-    mesg = font_style.render(msg, True, TEXT_COLOR)
-    rect = mesg.get_rect(center=(WIDTH // 2, HEIGHT // 2))
-    screen.blit(mesg, rect)
-
-
-def random_food_position():
-    """Random cell inside playfield."""
-    fx = random.randrange(0, PLAY_W)
-    fy = random.randrange(0, PLAY_H)
-    return fx, fy
-
-
-# --- Main game loop ---
-
-def gameLoop():
-    game_over = False
-    game_close = False
-
-    # snake head in grid coords (playfield)
-    gx = PLAY_W // 2
-    gy = PLAY_H // 2
-
-    dx, dy = 1, 0         # moving right
-    direction = "RIGHT"
-
-    snake_list = []
-    snake_len = 1
+from src.snake_env import (
+    SnakeEnv,
+    PLAY_W, PLAY_H, MARGIN_X, MARGIN_Y, UI_H,
+    SCALE, WIDTH, HEIGHT,
+    OUT_BG_COLOR, PLAY_BG_COLOR, UI_BG_COLOR, BORDER_COLOR,
+    SNAKE_BODY_COLOR, SNAKE_HEAD_COLOR, FOOD_COLOR, TEXT_COLOR,
+)
+
+SNAKE_SPEED = 12  # human-playable speed (ticks per second)
+
+# --- Game states ---
+PLAYING   = "PLAYING"
+GAME_OVER = "GAME_OVER"
+QUIT      = "QUIT"
+
+# keyboard -> SnakeEnv action (0=LEFT, 1=RIGHT, 2=UP, 3=DOWN)
+KEY_TO_ACTION = {
+    pygame.K_LEFT: 0,
+    pygame.K_RIGHT: 1,
+    pygame.K_UP: 2,
+    pygame.K_DOWN: 3,
+}
+DIRECTION_TO_ACTION = {"LEFT": 0, "RIGHT": 1, "UP": 2, "DOWN": 3}
+OPPOSITE_ACTION = {0: 1, 1: 0, 2: 3, 3: 2}
+
+# window uncovered/restored: the surface still holds the frame, just flip it
+EXPOSE_EVENTS = (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED)
+
+
+class SnakeGame:
+    """Human-playable Snake on top of SnakeEnv, redrawing only dirty cells."""
+
+    def __init__(self):
+        pygame.init()
+        self.screen = pygame.display.set_mode((WIDTH, HEIGHT))
+        pygame.display.set_caption("Snake - Nokia style")
+        # only wake up for events we actually handle
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed([pygame.QUIT, pygame.KEYDOWN,
+                                  *EXPOSE_EVENTS])
+
+        self.clock = pygame.time.Clock()
+        self.font = pygame.font.SysFont("bahnschrift", 16)
+        self.playfield_rect = pygame.Rect(MARGIN_X * SCALE, MARGIN_Y * SCALE,
+                                          PLAY_W * SCALE, PLAY_H * SCALE)
+
+        # logic only: the game owns the window and does its own drawing
+        self.env = SnakeEnv(render=False)
+        self.state = PLAYING
+
+    # ---------- drawing helpers ----------
+
+    def _cell_rect(self, gx, gy):
+        """Grid cell -> screen rect (scaled)."""
+        return pygame.Rect((MARGIN_X + gx) * SCALE, (MARGIN_Y + gy) * SCALE,
+                           SCALE, SCALE)
+
+    def _fill_cell(self, cell, color):
+        rect = self._cell_rect(*cell)
+        pygame.draw.rect(self.screen, color, rect)
+        if color == PLAY_BG_COLOR:
+            # edge cells overlap the border: restore it inside this cell only
+            self.screen.set_clip(rect)
+            pygame.draw.rect(self.screen, BORDER_COLOR, self.playfield_rect,
+                             width=1)
+            self.screen.set_clip(None)
+        return rect
+
+    def _draw_ui(self):
+        """Draw top bar and score, return its rect."""
+        rect = pygame.Rect(0, 0, WIDTH, UI_H * SCALE)
+        pygame.draw.rect(self.screen, UI_BG_COLOR, rect)
+        score = len(self.env.snake) - 1
+        text = self.font.render(f"Score: {score}", True, TEXT_COLOR)
+        self.screen.blit(text, (4, 2))
+        return rect
+
+    def _draw_full_frame(self):
+        """Paint everything once (new game only)."""
+        self.screen.fill(OUT_BG_COLOR)
+        self._draw_ui()
+        pygame.draw.rect(self.screen, PLAY_BG_COLOR, self.playfield_rect)
+        pygame.draw.rect(self.screen, BORDER_COLOR, self.playfield_rect,
+                         width=1)
+        self._fill_cell(self.env.food, FOOD_COLOR)
+        for cell in islice(self.env.snake, len(self.env.snake) - 1):
+            self._fill_cell(cell, SNAKE_BODY_COLOR)
+        self._fill_cell(self.env.snake[-1], SNAKE_HEAD_COLOR)
+        pygame.display.update()
 
-    food_x, food_y = random_food_position()
+    def _draw_game_over(self):
+        mesg = self.font.render("You lost! Q=Quit, C=Retry", True, TEXT_COLOR)
+        rect = mesg.get_rect(center=(WIDTH // 2, HEIGHT // 2))
+        self.screen.blit(mesg, rect)
+        pygame.display.update(rect)
 
-    while not game_over:
+    # ---------- states ----------
 
-        while game_close:
-            screen.fill(OUT_BG_COLOR)
-            draw_ui(score=snake_len - 1)
-            draw_playfield_bg_and_border()
-            message_center("You lost! Q=Quit, C=Retry")
-            pygame.display.update()
+    def _new_game(self):
+        self.env.reset()
+        self._draw_full_frame()
+        self.state = PLAYING
 
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    game_over = True
-                    game_close = False
-                if event.type == pygame.KEYDOWN:
-                    if event.key == pygame.K_q:
-                        game_over = True
-                        game_close = False
-                    if event.key == pygame.K_c:
-                        gameLoop()  # restart
-
-        # --- Input ---
+    def _read_action(self):
+        """Last valid arrow key this tick, else keep current direction."""
+        current = DIRECTION_TO_ACTION[self.env.direction]
+        action = current
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
-                game_over = True
-
-            if event.type == pygame.KEYDOWN:
-                # no reverse (no 180° turn)
-                if event.key == pygame.K_LEFT and direction != "RIGHT":
-                    dx, dy = -1, 0
-                    direction = "LEFT"
-                elif event.key == pygame.K_RIGHT and direction != "LEFT":
-                    dx, dy = 1, 0
-                    direction = "RIGHT"
-                elif event.key == pygame.K_UP and direction != "DOWN":
-                    dx, dy = 0, -1
-                    direction = "UP"
-                elif event.key == pygame.K_DOWN and direction != "UP":
-                    dx, dy = 0, 1
-                    direction = "DOWN"
-
-        # --- Move snake in grid ---
-        gx += dx
-        gy += dy
-
-        # wall collision (playfield)
-        if gx < 0 or gx >= PLAY_W or gy < 0 or gy >= PLAY_H:
-            game_close = True
-
-        # draw outside bg + UI
-        screen.fill(OUT_BG_COLOR)
-        draw_ui(score=snake_len - 1)
-
-        # playfield background + border
-        draw_playfield_bg_and_border()
-
-        # food
-        draw_food(food_x, food_y)
-
-        # snake update
-        head = [gx, gy]
-        snake_list.append(head)
-        if len(snake_list) > snake_len:
-            del snake_list[0]
-
-        # self collision
-        for segment in snake_list[:-1]:
-            if segment == head:
-                game_close = True
-
-        # draw snake
-        draw_snake(snake_list)
-
-        pygame.display.update()
-
-        # eat food
-        if gx == food_x and gy == food_y:
-            food_x, food_y = random_food_position()
-            snake_len += 1
+                self.state = QUIT
+            elif event.type in EXPOSE_EVENTS:
+                pygame.display.update()
+            elif event.type == pygame.KEYDOWN and event.key in KEY_TO_ACTION:
+                key_action = KEY_TO_ACTION[event.key]
+                # SnakeEnv drops 180° turns: don't let one erase a valid key
+                if key_action != OPPOSITE_ACTION[current]:
+                    action = key_action
+        return action
+
+    def _play_tick(self):
+        action = self._read_action()
+        if self.state == QUIT:
+            return
+
+        env = self.env
+        old_head = tuple(env.snake[-1])
+        old_tail = tuple(env.snake[0])
+        old_food = tuple(env.food)
+        old_len = len(env.snake)
+
+        _, _, done, _ = env.step(action)
+        if done:
+            self.state = GAME_OVER
+            self._draw_game_over()
+            return
+
+        # only the cells that changed this tick
+        dirty = []
+        grew = len(env.snake) > old_len
+        if not grew:
+            dirty.append(self._fill_cell(old_tail, PLAY_BG_COLOR))
+        if len(env.snake) > 1:
+            dirty.append(self._fill_cell(old_head, SNAKE_BODY_COLOR))
+        dirty.append(self._fill_cell(env.snake[-1], SNAKE_HEAD_COLOR))
+        if tuple(env.food) != old_food:
+            dirty.append(self._fill_cell(env.food, FOOD_COLOR))
+        if grew:
+            dirty.append(self._draw_ui())
+        pygame.display.update(dirty)
+
+        self.clock.tick(SNAKE_SPEED)
+
+    def _game_over_tick(self):
+        # block until input instead of spinning
+        event = pygame.event.wait()
+        if event.type == pygame.QUIT:
+            self.state = QUIT
+        elif event.type in EXPOSE_EVENTS:
+            pygame.display.update()
+        elif event.type == pygame.KEYDOWN:
+            if event.key == pygame.K_q:
+                self.state = QUIT
+            elif event.key == pygame.K_c:
+                self._new_game()
+
+    def run(self):
+        """Main loop: explicit state machine, no recursion on retry."""
+        self._new_game()
+        while self.state != QUIT:
+            if self.state == PLAYING:
+                self._play_tick()
+            elif self.state == GAME_OVER:
+                self._game_over_tick()
+        pygame.quit()
 
-        clock.tick(SNAKE_SPEED)
 
-    pygame.quit()
-    quit()
+def gameLoop():
+    SnakeGame().run()
 
 
 if __name__ == "__main__":
-    gameLoop()
\ No newline at end of file
+    gameLoop()
@@ -0,0 +1,129 @@
+import argparse
+import random
+import time
+from pathlib import Path
+
+import numpy as np
+import tensorflow as tf
+
+from src.snake_env import SnakeEnv
+from src.tflite_policy import TFLitePolicy
+
+ROOT = Path(__file__).resolve().parents[1]
+MODEL_PATH = ROOT / "models" / "dqn_snake.h5"
+FP16_PATH = ROOT / "models" / "dqn_snake_fp16.tflite"
+INT8_PATH = ROOT / "models" / "dqn_snake_int8.tflite"
+
+NUM_CALIBRATION_STATES = 1000
+NUM_BENCH_STATES = 2000
+NUM_LOAD_REPEATS = 5
+
+
+def sample_states(num_states, seed=0):
+    """Collect states from SnakeEnv with a random policy."""
+    random.seed(seed)
+    np.random.seed(seed)
+    env = SnakeEnv(render=False)
+    states = []
+    state = env.reset()
+    while len(states) < num_states:
+        states.append(state)
+        state, _, done, _ = env.step(np.random.randint(env.action_space))
+        if done:
+            state = env.reset()
+    env.close()
+    return np.array(states, dtype=np.float32)
+
+
+def convert(model, quantization, calibration_states=None):
+    """Keras model -> TFLite flatbuffer ("float16" or "int8")."""
+    converter = tf.lite.TFLiteConverter.from_keras_model(model)
+    converter.optimizations = [tf.lite.Optimize.DEFAULT]
+
+    if quantization == "float16":
+        converter.target_spec.supported_types = [tf.float16]
+    elif quantization == "int8":
+        def representative_dataset():
+            for s in calibration_states:
+                yield [s[np.newaxis, :]]
+
+        converter.representative_dataset = representative_dataset
+        converter.target_spec.supported_ops = [
+            tf.lite.OpsSet.TFLITE_BUILTINS_INT8
+        ]
+        converter.inference_input_type = tf.int8
+        converter.inference_output_type = tf.int8
+    else:
+        raise ValueError(f"Unknown quantization: {quantization}")
+
+    return converter.convert()
+
+
+def _time_load(load_fn, repeats=NUM_LOAD_REPEATS):
+    """Return (obj, cold load time, best warm load time)."""
+    times = []
+    for _ in range(repeats):
+        t0 = time.perf_counter()
+        obj = load_fn()
+        times.append(time.perf_counter() - t0)
+    return obj, times[0], min(times[1:], default=times[0])
+
+
+def _time_calls(fn, states):
+    t0 = time.perf_counter()
+    out = [fn(s) for s in states]
+    return out, (time.perf_counter() - t0) / len(states)
+
+
+def report(model_path, tflite_paths, states):
+    """Print size, load time, per-call latency and action agreement."""
+    keras_model, keras_cold, keras_warm = _time_load(
+        lambda: tf.keras.models.load_model(str(model_path), compile=False)
+    )
+    keras_actions, keras_lat = _time_calls(
+        lambda s: int(np.argmax(keras_model(s[np.newaxis, :],
+                                            training=False)[0])),
+        states,
+    )
+    keras_actions = np.array(keras_actions)
+
+    # same protocol for every model: first (cold) load and best of the rest
+    print(f"{'model':<28}{'size KB':>10}{'cold ms':>10}{'warm ms':>10}"
+          f"{'call us':>10}{'agree %':>10}")
+    print(f"{model_path.name:<28}{model_path.stat().st_size / 1024:>10.1f}"
+          f"{keras_cold * 1e3:>10.1f}{keras_warm * 1e3:>10.1f}"
+          f"{keras_lat * 1e6:>10.1f}{100.0:>10.1f}")
+
+    for path in tflite_paths:
+        policy, cold, warm = _time_load(lambda: TFLitePolicy(path))
+        actions, lat = _time_calls(policy.act, states)
+        agree = np.mean(np.array(actions) == keras_actions) * 100
+        print(f"{path.name:<28}{path.stat().st_size / 1024:>10.1f}"
+              f"{cold * 1e3:>10.1f}{warm * 1e3:>10.1f}"
+              f"{lat * 1e6:>10.1f}{agree:>10.1f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Export the DQN policy to quantized TFLite.")
+    parser.add_argument("--model", type=Path, default=MODEL_PATH)
+    parser.add_argument("--fp16-out", type=Path, default=FP16_PATH)
+    parser.add_argument("--int8-out", type=Path, default=INT8_PATH)
+    parser.add_argument("--calibration-states", type=int,
+                        default=NUM_CALIBRATION_STATES)
+    args = parser.parse_args()
+
+    model = tf.keras.models.load_model(str(args.model), compile=False)
+    calibration = sample_states(args.calibration_states, seed=0)
+
+    args.fp16_out.write_bytes(convert(model, "float16"))
+    args.int8_out.write_bytes(convert(model, "int8", calibration))
+    print(f"Saved {args.fp16_out} and {args.int8_out}")
+
+    # held-out states (different seed) for the comparison
+    report(args.model, [args.fp16_out, args.int8_out],
+           sample_states(NUM_BENCH_STATES, seed=1))
+
+
+if __name__ == "__main__":
+    main()
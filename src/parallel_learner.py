@@ -0,0 +1,145 @@
+import multiprocessing as mp
+import numpy as np
+
+
+def _worker(conn, model_json, num_threads):
+    """
+    Replica worker. Messages (in pipe order):
+      ("sync", weights, optimizer_config) -> load weights, fresh optimizer
+      ("grads", x, y, scale)              -> send back shard gradients
+      ("apply", grads)                    -> apply the reduced gradients
+      ("get",)                            -> send back current weights
+      None                                -> exit
+    """
+    import tensorflow as tf
+    tf.config.threading.set_intra_op_parallelism_threads(num_threads)
+    tf.config.threading.set_inter_op_parallelism_threads(1)
+
+    model = tf.keras.models.model_from_json(model_json)
+    state_size = model.input_shape[-1]
+    action_size = model.output_shape[-1]
+    optimizer = None
+
+    @tf.function(input_signature=[
+        tf.TensorSpec([None, state_size], tf.float32),
+        tf.TensorSpec([None, action_size], tf.float32),
+        tf.TensorSpec([], tf.float32),
+    ])
+    def compute_grads(x, y, scale):
+        with tf.GradientTape() as tape:
+            q = model(x, training=True)
+            # per-sample MSE summed, scaled by 1/global_batch so that the
+            # sum over shards equals the gradient of Keras' mean "mse" loss
+            per_sample = tf.reduce_mean(tf.square(y - q), axis=1)
+            loss = tf.reduce_sum(per_sample) * scale
+        return tape.gradient(loss, model.trainable_variables)
+
+    while True:
+        msg = conn.recv()
+        if msg is None:
+            break
+        kind = msg[0]
+        if kind == "sync":
+            _, weights, optimizer_config = msg
+            model.set_weights(weights)
+            optimizer = tf.keras.optimizers.deserialize(optimizer_config)
+        elif kind == "grads":
+            _, x, y, scale = msg
+            grads = compute_grads(x, y, np.float32(scale))
+            conn.send([g.numpy() for g in grads])
+        elif kind == "apply":
+            optimizer.apply_gradients(zip(msg[1], model.trainable_variables))
+        elif kind == "get":
+            conn.send(model.get_weights())
+    conn.close()
+
+
+class ParallelLearner:
+    """
+    Data-parallel learner over local worker processes.
+
+    Every worker keeps its own replica of the model and optimizer. Each
+    update sends one shard of the minibatch to every worker, sums the
+    shard gradients in the parent and sends the sum back, and every
+    replica (the parent model included) applies that same reduced
+    gradient with an identical optimizer, so all copies stay in step.
+    Only gradients cross the pipes; weights go out once at start and
+    again from set_model() (e.g. after DQNAgent.load).
+    """
+
+    def __init__(self, model, num_workers, threads_per_worker=1):
+        self.num_workers = num_workers
+
+        ctx = mp.get_context("spawn")  # TF is not fork-safe
+        self._conns = []
+        self._procs = []
+        model_json = model.to_json()
+        for _ in range(num_workers):
+            parent_conn, child_conn = ctx.Pipe()
+            proc = ctx.Process(target=_worker,
+                               args=(child_conn, model_json,
+                                     threads_per_worker),
+                               daemon=True)
+            proc.start()
+            child_conn.close()
+            self._conns.append(parent_conn)
+            self._procs.append(proc)
+
+        self.set_model(model)
+
+    def set_model(self, model):
+        """Use `model` (compiled) as the master copy and resync workers."""
+        import tensorflow as tf
+        self.model = model
+        weights = model.get_weights()
+        optimizer_config = tf.keras.optimizers.serialize(model.optimizer)
+        for conn in self._conns:
+            conn.send(("sync", weights, optimizer_config))
+
+    def train_on_batch(self, states, targets):
+        """One gradient step on (states, targets), like model.train_on_batch."""
+        states = np.asarray(states, dtype=np.float32)
+        targets = np.asarray(targets, dtype=np.float32)
+        scale = 1.0 / len(states)
+
+        shards = np.array_split(np.arange(len(states)), self.num_workers)
+        for conn, idx in zip(self._conns, shards):
+            conn.send(("grads", states[idx], targets[idx], scale))
+
+        # reduce: sum shard gradients in the parent
+        grads = self._conns[0].recv()
+        for conn in self._conns[1:]:
+            for total, g in zip(grads, conn.recv()):
+                total += g
+
+        # broadcast: every replica applies the same reduced gradient
+        # (no ack needed, pipe order guarantees it lands before next step)
+        for conn in self._conns:
+            conn.send(("apply", grads))
+        self.model.optimizer.apply_gradients(
+            zip(grads, self.model.trainable_variables))
+
+    def fit(self, states, targets, batch_size=32, shuffle=True):
+        """One epoch in batch_size steps, like model.fit(epochs=1)."""
+        n = len(states)
+        order = np.random.permutation(n) if shuffle else np.arange(n)
+        for start in range(0, n, batch_size):
+            idx = order[start:start + batch_size]
+            self.train_on_batch(states[idx], targets[idx])
+
+    def worker_weights(self):
+        """Current weights of every worker replica (for checks)."""
+        for conn in self._conns:
+            conn.send(("get",))
+        return [conn.recv() for conn in self._conns]
+
+    def close(self):
+        for conn in self._conns:
+            try:
+                conn.send(None)
+            except (BrokenPipeError, OSError):
+                pass
+        for proc in self._procs:
+            proc.join(timeout=5)
+        self._conns = []
+        self._procs = []
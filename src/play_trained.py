@@ -1,13 +1,26 @@
 from src.snake_env import SnakeEnv
-from src.dqn_agent import DQNAgent
 from pathlib import Path
+import argparse
 import numpy as np
 
 
 ROOT = Path(__file__).resolve().parents[1]
 MODEL_PATH = ROOT / "models" / "dqn_snake.h5"
 
-def play_one_episode():
+def load_policy(state_size, action_size, tflite_path=None):
+    """Keras agent by default, TFLite interpreter if a .tflite path is given."""
+    # imported lazily so TFLite playback never pulls in Keras
+    if tflite_path is not None:
+        from src.tflite_policy import TFLitePolicy
+        return TFLitePolicy(tflite_path)
+
+    from src.dqn_agent import DQNAgent
+    agent = DQNAgent(state_size, action_size)
+    agent.load(str(MODEL_PATH))
+    agent.epsilon = 0.0  # no random actions
+    return agent
+
+def play_one_episode(tflite_path=None):
     # env with render enabled
     env = SnakeEnv(render=True)
     state = env.reset()
@@ -16,9 +29,7 @@ def play_one_episode():
     action_size = env.action_space
 
     # create agent and load trained model
-    agent = DQNAgent(state_size, action_size)
-    agent.load(str(MODEL_PATH))
-    agent.epsilon = 0.0  # no random actions
+    agent = load_policy(state_size, action_size, tflite_path)
 
     done = False
     total_reward = 0.0
@@ -40,4 +51,8 @@ def play_one_episode():
     env.close()
 
 if __name__ == "__main__":
-    play_one_episode()
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--tflite", type=Path, default=None,
+                        help="play with an exported .tflite model instead")
+    args = parser.parse_args()
+    play_one_episode(args.tflite)
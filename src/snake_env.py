@@ -1,5 +1,7 @@
 import pygame
 import random
+from collections import deque
+from itertools import islice
 import numpy as np
 
 # --- Nokia logical screen ---
@@ -63,7 +65,7 @@ class SnakeEnv:
         if not self.snake:
             return
         # body
-        for gx, gy in self.snake[:-1]:
+        for gx, gy in islice(self.snake, len(self.snake) - 1):
             sx, sy = self.grid_to_screen(gx, gy)
             pygame.draw.rect(self.screen, SNAKE_BODY_COLOR,
                              [sx, sy, SCALE, SCALE])
@@ -100,7 +102,7 @@ class SnakeEnv:
         """Check if (x,y) hits wall or body."""
         if x < 0 or x >= PLAY_W or y < 0 or y >= PLAY_H:
             return True
-        if [x, y] in self.snake:
+        if (x, y) in self.snake_cells:
             return True
         return False
 
@@ -113,7 +115,8 @@ class SnakeEnv:
         self.dx, self.dy = 1, 0
         self.direction = "RIGHT"   # <-- IMPORTANT
 
-        self.snake = [[self.gx, self.gy]]
+        self.snake = deque([[self.gx, self.gy]])  # head at the right end
+        self.snake_cells = {(self.gx, self.gy)}  # O(1) body lookups
         self.food = self._random_food_position()
         self.done = False
         return self._get_state()
@@ -171,6 +174,7 @@ class SnakeEnv:
         # update snake body
         new_head = [self.gx, self.gy]
         self.snake.append(new_head)
+        self.snake_cells.add((self.gx, self.gy))
 
         # check food eaten
         if self.gx == self.food[0] and self.gy == self.food[1]:
@@ -178,7 +182,8 @@ class SnakeEnv:
             self.food = self._random_food_position()
         else:
             # normal move: remove tail
-            del self.snake[0]
+            tail_x, tail_y = self.snake.popleft()
+            self.snake_cells.discard((tail_x, tail_y))
 
         state = self._get_state()
         return state, reward, self.done, {}
@@ -211,7 +216,7 @@ class SnakeEnv:
         while True:
             fx = random.randrange(0, PLAY_W)
             fy = random.randrange(0, PLAY_H)
-            if [fx, fy] not in self.snake:
+            if (fx, fy) not in self.snake_cells:
                 return [fx, fy]
 
     def _get_state(self):
@@ -0,0 +1,47 @@
+import numpy as np
+
+# prefer the small runtime on playback boxes, fall back to full TF
+try:
+    from tflite_runtime.interpreter import Interpreter
+except ImportError:
+    import tensorflow as tf
+    Interpreter = tf.lite.Interpreter
+
+
+class TFLitePolicy:
+    """Greedy DQN policy backed by a TFLite interpreter (float16 or int8)."""
+
+    def __init__(self, path, num_threads=1):
+        self.interpreter = Interpreter(model_path=str(path),
+                                       num_threads=num_threads)
+        self.interpreter.allocate_tensors()
+
+        inp = self.interpreter.get_input_details()[0]
+        out = self.interpreter.get_output_details()[0]
+        self._in_index = inp["index"]
+        self._in_dtype = inp["dtype"]
+        self._in_scale, self._in_zero = inp["quantization"]
+        self._out_index = out["index"]
+        self._out_scale, self._out_zero = out["quantization"]
+
+        self.state_size = inp["shape"][-1]
+        self.action_size = out["shape"][-1]
+        self.epsilon = 0.0  # same attribute as DQNAgent, always greedy
+
+    def q_values(self, state):
+        """Q-values for a single state, as float32."""
+        x = np.asarray(state, dtype=np.float32)[np.newaxis, :]
+        if self._in_dtype != np.float32:
+            # int8 input: quantize with the model's own scale / zero point
+            x = np.round(x / self._in_scale + self._in_zero)
+            x = x.astype(self._in_dtype)
+        self.interpreter.set_tensor(self._in_index, x)
+        self.interpreter.invoke()
+        q = self.interpreter.get_tensor(self._out_index)[0]
+        if self._out_scale:
+            q = (q.astype(np.float32) - self._out_zero) * self._out_scale
+        return q.astype(np.float32)
+
+    def act(self, state):
+        """Greedy action, drop-in for DQNAgent.act with epsilon=0."""
+        return int(np.argmax(self.q_values(state)))
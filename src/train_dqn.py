@@ -8,13 +8,14 @@ MODEL_PATH = ROOT / "models" / "dqn_snake.h5"
 
 NUM_EPISODES = 500       # puedes empezar con 200 para probar
 TARGET_UPDATE_FREQ = 10  # episodios
+NUM_LEARNERS = 1         # >1: data-parallel learner over worker processes
 
 def train():
     env = SnakeEnv(render=False)   # sin render para entrenar rápido
     state_size = env.reset().shape[0]
     action_size = env.action_space
 
-    agent = DQNAgent(state_size, action_size)
+    agent = DQNAgent(state_size, action_size, num_learners=NUM_LEARNERS)
 
     for e in range(1, NUM_EPISODES + 1):
         state = env.reset()
@@ -52,6 +53,7 @@ def train():
 
     # save model
     agent.save(str(MODEL_PATH))
+    agent.close()
     env.close()
 
 if __name__ == "__main__":
@@ -0,0 +1,83 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from src.compact_replay import CompactReplayBuffer
+
+STATE_SIZE = 11
+
+
+def _state(code):
+    return np.array([(code >> b) & 1 for b in range(STATE_SIZE)],
+                    dtype=np.float32)
+
+
+def _done_bits(buf):
+    idx = np.arange(buf.capacity)
+    return ((buf.dones[idx >> 3] >> (idx & 7).astype(np.uint8)) & 1).astype(bool)
+
+
+def test_pack_unpack_round_trip():
+    buf = CompactReplayBuffer(4, STATE_SIZE)
+    states = np.array([_state(c) for c in range(2 ** STATE_SIZE)])
+    codes = buf.pack(states)
+    assert codes.dtype == np.uint16
+    assert np.array_equal(codes, np.arange(2 ** STATE_SIZE))
+    assert np.array_equal(buf.unpack(codes), states)
+
+
+def test_append_wraps_and_keeps_done_bits():
+    # capacity 13 spans two done bytes and wraps mid-byte
+    buf = CompactReplayBuffer(13, STATE_SIZE, seed=0)
+    for i in range(30):
+        buf.append((_state(i), i % 4, float(i), _state(i + 1), i % 3 == 0))
+
+    assert len(buf) == 13
+    # slot j holds the newest i with i % 13 == j
+    newest = np.array([max(i for i in range(30) if i % 13 == j)
+                       for j in range(13)])
+    assert np.array_equal(buf.states, newest.astype(np.uint16))
+    assert np.array_equal(buf.next_states, (newest + 1).astype(np.uint16))
+    assert np.array_equal(buf.actions, newest % 4)
+    assert np.array_equal(_done_bits(buf), newest % 3 == 0)
+
+
+def test_extend_matches_append():
+    transitions = [(_state(i), i % 4, [-10.0, -0.5, 1.0, 11.0][i % 4],
+                    _state(i + 1), i % 5 == 0) for i in range(37)]
+    a = CompactReplayBuffer(16, STATE_SIZE)
+    b = CompactReplayBuffer(16, STATE_SIZE)
+    for t in transitions:
+        a.append(t)
+    b.extend(transitions[:10])
+    b.extend(transitions[10:])
+
+    for name in ("states", "next_states", "actions", "rewards", "dones"):
+        assert np.array_equal(getattr(a, name), getattr(b, name))
+    assert len(a) == len(b) == 16
+
+
+def test_sample_shapes_and_values():
+    buf = CompactReplayBuffer(100, STATE_SIZE, seed=0)
+    for i in range(100):
+        buf.append((_state(i), i % 4, 1.0, _state(i + 1), i % 2 == 0))
+
+    states, actions, rewards, next_states, dones = buf.sample(64)
+    assert states.shape == next_states.shape == (64, STATE_SIZE)
+    assert states.dtype == np.float32
+    codes = buf.pack(states).astype(np.int64)
+    assert np.array_equal(buf.pack(next_states), codes + 1)
+    assert np.array_equal(actions, codes % 4)
+    assert np.array_equal(dones, codes % 2 == 0)
+    assert np.all(rewards == 1.0)
+
+
+def test_agent_remember_and_replay_with_compact_memory():
+    pytest.importorskip("tensorflow")
+    from src.dqn_agent import DQNAgent
+
+    agent = DQNAgent(STATE_SIZE, 4, memory_size=1000, compact_memory=True)
+    for i in range(agent.batch_size + 1):
+        agent.remember(_state(i), i % 4, -0.5, _state(i + 1), False)
+    assert len(agent.memory) == agent.batch_size + 1
+    agent.replay()
@@ -0,0 +1,56 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+tf = pytest.importorskip("tensorflow")
+
+from src.dqn_agent import build_mlp
+from src.parallel_learner import ParallelLearner
+
+STATE_SIZE = 11
+ACTION_SIZE = 4
+
+
+def _compiled_mlp():
+    model = build_mlp(STATE_SIZE, ACTION_SIZE, (32, 32))
+    model.compile(loss="mse",
+                  optimizer=tf.keras.optimizers.Adam(learning_rate=1e-3))
+    return model
+
+
+def _max_diff(weights_a, weights_b):
+    return max(np.max(np.abs(a - b)) for a, b in zip(weights_a, weights_b))
+
+
+def test_sharded_steps_match_keras_train_on_batch():
+    reference = _compiled_mlp()
+    parallel = _compiled_mlp()
+    parallel.set_weights(reference.get_weights())
+
+    rng = np.random.default_rng(0)
+    learner = ParallelLearner(parallel, num_workers=3)
+    try:
+        for _ in range(5):
+            states = rng.integers(0, 2, (64, STATE_SIZE)).astype(np.float32)
+            targets = rng.normal(size=(64, ACTION_SIZE)).astype(np.float32)
+            reference.train_on_batch(states, targets)
+            learner.train_on_batch(states, targets)
+
+        assert _max_diff(parallel.get_weights(),
+                         reference.get_weights()) < 1e-5
+        # every replica applied the same reduced gradients
+        for weights in learner.worker_weights():
+            assert _max_diff(weights, parallel.get_weights()) < 1e-6
+    finally:
+        learner.close()
+
+
+def test_set_model_resyncs_workers():
+    model = _compiled_mlp()
+    learner = ParallelLearner(model, num_workers=2)
+    try:
+        other = _compiled_mlp()
+        learner.set_model(other)
+        for weights in learner.worker_weights():
+            assert _max_diff(weights, other.get_weights()) == 0
+    finally:
+        learner.close()